@@ -1,9 +1,14 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Mapping
 
 from pplkit.data.io import DataIO, dataio_dict
 
+_CURRENT_DIR = Path(".")
+_FPATH_CACHE_SIZE = 1024
+
 
 class DataInterface:
     """Data interface that store important directories and automatically read
@@ -18,7 +23,7 @@ class DataInterface:
 
     """
 
-    dataio_dict: dict[str, DataIO] = dataio_dict
+    dataio_dict: Mapping[str, DataIO] = dataio_dict
     """A dictionary that maps the file extensions to the corresponding data io
     class. This is a module-level variable from
     :py:data:`pplkit.data.io.dataio_dict`.
@@ -29,6 +34,11 @@ class DataInterface:
 
     def __init__(self, **dirs: dict[str, str | Path]) -> None:
         self.keys = []
+        # joined file paths with their suffixes, keyed by the directory path so
+        # that reassigned directories are picked up
+        self._fpath_cache: dict[tuple[tuple, Path], tuple[Path, str]] = {}
+        # parent directories already created by dump
+        self._ensured_dirs: set[Path] = set()
         for key, value in dirs.items():
             self.add_dir(key, value)
 
@@ -50,13 +60,21 @@ class DataInterface:
         ------
         ValueError
             Raised when ``exist_ok=False`` and ``key`` already exists.
+        ValueError
+            Raised when ``load_{key}`` or ``dump_{key}`` is already a method of
+            the class, e.g. ``key="many"``.
 
         """
         if (not exist_ok) and (key in self.keys):
             raise ValueError(f"{key} already exists")
-        setattr(self, key, Path(value))
-        setattr(self, f"load_{key}", partial(self.load, key=key))
-        setattr(self, f"dump_{key}", partial(self.dump, key=key))
+        for prefix in ("load", "dump"):
+            if hasattr(type(self), f"{prefix}_{key}"):
+                raise ValueError(
+                    f"{key} is reserved, {prefix}_{key} is already a method of "
+                    f"{type(self).__name__}"
+                )
+        setattr(self, key, value if isinstance(value, Path) else Path(value))
+        self._fpath_cache.clear()
         if key not in self.keys:
             self.keys.append(key)
 
@@ -71,9 +89,10 @@ class DataInterface:
         """
         if key in self.keys:
             delattr(self, key)
-            delattr(self, f"load_{key}")
-            delattr(self, f"dump_{key}")
+            self.__dict__.pop(f"load_{key}", None)
+            self.__dict__.pop(f"dump_{key}", None)
             self.keys.remove(key)
+            self._fpath_cache.clear()
 
     def get_fpath(self, *fparts: tuple[str, ...], key: str = "") -> Path:
         """Get the file path from the name of the directory and the sub-parts
@@ -87,7 +106,20 @@ class DataInterface:
             The name of the directory stored in the class.
 
         """
-        return getattr(self, key, Path(".")) / "/".join(map(str, fparts))
+        return self._resolve_fpath(fparts, key)[0]
+
+    def _resolve_fpath(self, fparts: tuple[str, ...], key: str) -> tuple[Path, str]:
+        # directories are public attributes, read them on every call
+        dirpath = getattr(self, key, _CURRENT_DIR)
+        try:
+            return self._fpath_cache[fparts, dirpath]
+        except KeyError:
+            pass
+        if len(self._fpath_cache) >= _FPATH_CACHE_SIZE:
+            self._fpath_cache.clear()
+        fpath = dirpath / "/".join(map(str, fparts))
+        self._fpath_cache[fparts, dirpath] = fpath, fpath.suffix
+        return fpath, fpath.suffix
 
     def load(
         self, *fparts: tuple[str, ...], key: str = "", **options: dict[str, Any]
@@ -109,8 +141,10 @@ class DataInterface:
             Data loaded from the given path.
 
         """
-        fpath = self.get_fpath(*fparts, key=key)
-        return self.dataio_dict[fpath.suffix].load(fpath, **options)
+        # skip get_fpath and go to the cache directly on the hot path
+        fpath, suffix = self._resolve_fpath(fparts, key)
+        # the data io is selected by the suffix, no need to check it again
+        return self.dataio_dict[suffix]._load(fpath, **options)
 
     def dump(
         self,
@@ -137,12 +171,161 @@ class DataInterface:
             Extra arguments for the dump function.
 
         """
-        fpath = self.get_fpath(*fparts, key=key)
-        self.dataio_dict[fpath.suffix].dump(obj, fpath, mkdir=mkdir, **options)
+        fpath, suffix = self._resolve_fpath(fparts, key)
+        dataio = self.dataio_dict[suffix]
+        # skip mkdir for the directories that were already created
+        if fpath.parent in self._ensured_dirs:
+            try:
+                return dataio.dump(obj, fpath, mkdir=False, **options)
+            except OSError:
+                # the directory was removed after it was created, writers such
+                # as pandas' to_parquet raise a plain OSError for it
+                if fpath.parent.is_dir():
+                    raise
+                self._ensured_dirs.discard(fpath.parent)
+        dataio.dump(obj, fpath, mkdir=mkdir, **options)
+        if mkdir:
+            self._ensured_dirs.add(fpath.parent)
+
+    def load_many(
+        self,
+        fnames: Iterable[str | Path],
+        key: str = "",
+        max_workers: int | None = None,
+        **options: dict[str, Any],
+    ) -> list[Any]:
+        """Load data from multiple files in the given directory concurrently
+        with a thread pool.
+
+        Parameters
+        ----------
+        fnames
+            File names or sub-paths under the directory.
+        key
+            The name of the directory stored in the class.
+        max_workers
+            Maximum number of threads. The default is the default of
+            :class:`concurrent.futures.ThreadPoolExecutor`.
+        options
+            Extra arguments for the load function, shared by all files.
+
+        Returns
+        -------
+        list[Any]
+            Data loaded from the given paths, in the same order.
+
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(lambda fname: self.load(fname, key=key, **options), fnames)
+            )
+
+    async def load_many_async(
+        self, fnames: Iterable[str | Path], key: str = "", **options: dict[str, Any]
+    ) -> list[Any]:
+        """Load data from multiple files in the given directory concurrently
+        from a coroutine. Each file is loaded with :func:`asyncio.to_thread`,
+        so the event loop is not blocked while the files are read and parsed.
+
+        Parameters
+        ----------
+        fnames
+            File names or sub-paths under the directory.
+        key
+            The name of the directory stored in the class.
+        options
+            Extra arguments for the load function, shared by all files.
+
+        Returns
+        -------
+        list[Any]
+            Data loaded from the given paths, in the same order.
+
+        """
+        return await asyncio.gather(
+            *(
+                asyncio.to_thread(self.load, fname, key=key, **options)
+                for fname in fnames
+            )
+        )
+
+    def dump_many(
+        self,
+        objs: Iterable[Any],
+        fnames: Iterable[str | Path],
+        key: str = "",
+        mkdir: bool = True,
+        max_workers: int | None = None,
+        **options: dict[str, Any],
+    ):
+        """Dump multiple data objects to the given directory concurrently with a
+        thread pool.
+
+        Parameters
+        ----------
+        objs
+            Provided data objects.
+        fnames
+            File names or sub-paths under the directory, one for each object.
+        key
+            The name of the directory stored in the class.
+        mkdir
+            If true, it will automatically create the parent directory. The
+            default is true.
+        max_workers
+            Maximum number of threads. The default is the default of
+            :class:`concurrent.futures.ThreadPoolExecutor`.
+        options
+            Extra arguments for the dump function, shared by all files.
+
+        Raises
+        ------
+        ValueError
+            Raised when the numbers of objects and file names don't match.
+
+        """
+        objs, fnames = list(objs), list(fnames)
+        if len(objs) != len(fnames):
+            raise ValueError(
+                f"Got {len(objs)} objects but {len(fnames)} file names, they must "
+                "match."
+            )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # consume the iterator to raise the first error if any
+            list(
+                executor.map(
+                    lambda obj, fname: self.dump(
+                        obj, fname, key=key, mkdir=mkdir, **options
+                    ),
+                    objs,
+                    fnames,
+                )
+            )
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the caches and the load_{key} and dump_{key} partials belong to this
+        # instance, copies and unpickled instances start with their own
+        bound = {f"{prefix}_{key}" for key in self.keys for prefix in ("load", "dump")}
+        state = {
+            name: value for name, value in self.__dict__.items() if name not in bound
+        }
+        state["keys"] = list(self.keys)
+        state["_fpath_cache"] = {}
+        state["_ensured_dirs"] = set()
+        return state
+
+    def __getattr__(self, name: str) -> partial:
+        # load_{key} and dump_{key} are created on first access and cached on
+        # the instance
+        prefix, _, key = name.partition("_")
+        if prefix in ("load", "dump") and key in self.__dict__.get("keys", ()):
+            func = partial(getattr(self, prefix), key=key)
+            setattr(self, name, func)
+            return func
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
 
     def __repr__(self) -> str:
-        expr = f"{type(self).__name__}(\n"
-        for key in self.keys:
-            expr += f"    {key}={getattr(self, key)},\n"
-        expr += ")"
-        return expr
+        dirs = "".join(f"    {key}={getattr(self, key)},\n" for key in self.keys)
+        return f"{type(self).__name__}(\n{dirs})"
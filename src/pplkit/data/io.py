@@ -1,13 +1,36 @@
+from __future__ import annotations
+
+import importlib
 import json
+import math
+import mmap
+import os
+import pickle
+import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Type
-
-import dill
-import pandas as pd
-import tomli
-import tomli_w
-import yaml
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, Type
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    # msgspec is only used as the fast json backend when orjson is missing
+    try:
+        import msgspec.json
+    except ImportError:
+        msgspec = None
+else:
+    msgspec = None
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
 
 
 class DataIO(ABC):
@@ -24,6 +47,11 @@ class DataIO(ABC):
 
     """
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # frozen set of the file extensions for constant time validation
+        cls._fextn_set = frozenset(cls.fextns)
+
     @abstractmethod
     def _load(self, fpath: Path, **options) -> Any:
         pass
@@ -53,8 +81,9 @@ class DataIO(ABC):
             Data loaded from the given path.
 
         """
-        fpath = Path(fpath)
-        if fpath.suffix not in self.fextns:
+        if not isinstance(fpath, Path):
+            fpath = Path(fpath)
+        if fpath.suffix not in self._fextn_set:
             raise ValueError(f"File extension must be in {self.fextns}.")
         return self._load(fpath, **options)
 
@@ -79,7 +108,8 @@ class DataIO(ABC):
             Raised when the given data object type doesn't match.
 
         """
-        fpath = Path(fpath)
+        if not isinstance(fpath, Path):
+            fpath = Path(fpath)
         if not isinstance(obj, self.dtypes):
             raise TypeError(f"Data must be an instance of {self.dtypes}.")
         if mkdir:
@@ -90,105 +120,627 @@ class DataIO(ABC):
         return f"{type(self).__name__}()"
 
 
-class CSVIO(DataIO):
-    fextns: tuple[str, ...] = (".csv",)
-    dtypes: tuple[Type, ...] = (pd.DataFrame,)
+_dataio_dict: dict[str, DataIO] = {}
+
+
+def register_dataio(cls: Type[DataIO]) -> Type[DataIO]:
+    """Class decorator that registers an instance of the data io class under
+    each of its file extensions in :py:data:`dataio_dict`. A later
+    registration of the same file extension overwrites the earlier one.
+
+    Parameters
+    ----------
+    cls
+        Data io class to register.
+
+    Returns
+    -------
+    Type[DataIO]
+        The data io class itself.
+
+    """
+    dataio = cls()
+    for fextn in cls.fextns:
+        _dataio_dict[fextn] = dataio
+    return cls
+
+
+_MMAP_THRESHOLD = 1 << 20
+_BUFFER_SIZE = 1 << 20
+
+
+@contextmanager
+def _read_buffer(fpath: Path) -> Iterator[bytes | memoryview]:
+    # small files are read at once, large files are memory-mapped so that the
+    # parser works on the page cache without an extra copy of the content, the
+    # file is never read in chunks so the raw unbuffered file is enough
+    with open(fpath, "rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                yield view
+
+
+class _LazyDtypes:
+    """Data types of a data io that are imported on first access, from the
+    class or from an instance.
+
+    Parameters
+    ----------
+    module
+        Name of the module that defines the data types.
+    names
+        Names of the data types in the module.
+
+    """
+
+    def __init__(self, module: str, *names: str) -> None:
+        self.module = module
+        self.names = names
+        self._dtypes = None
+
+    def __get__(self, obj: DataIO | None, cls: Type[DataIO]) -> tuple[Type, ...]:
+        if self._dtypes is None:
+            module = importlib.import_module(self.module)
+            self._dtypes = tuple(getattr(module, name) for name in self.names)
+        return self._dtypes
+
+
+class _PandasDataIO(DataIO):
+    """Base class for data ios of :class:`pandas.DataFrame`. Pandas is only
+    imported when the data types are checked or a file is loaded.
+
+    """
 
-    def _load(self, fpath: Path, **options) -> pd.DataFrame:
+    dtypes = _LazyDtypes("pandas", "DataFrame")
+
+
+# options of pandas.read_csv that are supported by the pyarrow engine
+_PYARROW_CSV_OPTIONS = frozenset(
+    {
+        "sep",
+        "delimiter",
+        "header",
+        "names",
+        "index_col",
+        "usecols",
+        "dtype",
+        "true_values",
+        "false_values",
+        "na_values",
+        "keep_default_na",
+        "na_filter",
+        "parse_dates",
+        "date_format",
+        "encoding",
+        "quotechar",
+        "escapechar",
+        "doublequote",
+        "decimal",
+        "compression",
+        "dtype_backend",
+    }
+)
+
+
+def _pyarrow_csv_supported(options: dict) -> bool:
+    # the pyarrow engine of pandas.read_csv supports fewer option values than
+    # the C engine: no integer positions or callables in usecols, no dict
+    # na_values and no index_col=False
+    if not options.keys() <= _PYARROW_CSV_OPTIONS:
+        return False
+    usecols = options.get("usecols")
+    if callable(usecols) or (
+        usecols is not None and any(not isinstance(col, str) for col in usecols)
+    ):
+        return False
+    if isinstance(options.get("na_values"), dict):
+        return False
+    return options.get("index_col") is not False
+
+
+@register_dataio
+class CSVIO(_PandasDataIO):
+    """Data io for csv files. Loaded data frames are backed by pyarrow arrays
+    by default, pass ``dtype_backend="numpy_nullable"`` for the pandas nullable
+    dtypes, or ``dtype_backend=None`` to read with the pandas defaults, i.e.
+    the C parser and numpy dtypes. Pass
+    ``engine="polars"`` to parse large files with polars, the result is still
+    converted to a :class:`pandas.DataFrame`. Pass ``as_arrow=True`` to get
+    the :class:`pyarrow.Table` from :func:`pyarrow.csv.read_csv` without the
+    pandas conversion, the other options are then passed to pyarrow.
+
+    Data frames are dumped with :meth:`pandas.DataFrame.to_csv`. Pass
+    ``engine="pyarrow"`` to dump large frames with the multithreaded
+    :func:`pyarrow.csv.write_csv` instead, which quotes all strings and writes
+    booleans and dates in the Arrow format. It is only used without other
+    options and for frames with flat unique column names.
+
+    """
+
+    fextns: tuple[str, ...] = (".csv",)
+    _load_defaults = MappingProxyType(dict(dtype_backend="pyarrow"))
+    _dump_defaults = MappingProxyType(dict(index=False))
+
+    def _load(
+        self, fpath: Path, as_arrow: bool = False, **options
+    ) -> pd.DataFrame | pa.Table:
+        if as_arrow:
+            import pyarrow.csv as pacsv
+
+            return pacsv.read_csv(fpath, **options)
+        if options.get("engine") == "polars":
+            import polars as pl
+
+            del options["engine"]
+            return pl.read_csv(fpath, **options).to_pandas(
+                use_pyarrow_extension_array=True
+            )
+
+        import pandas as pd
+
+        # dtype_backend=None keeps all the pandas defaults
+        if "dtype_backend" in options and options["dtype_backend"] is None:
+            del options["dtype_backend"]
+            return pd.read_csv(fpath, **options)
+        # use the multithreaded pyarrow parser unless an option requires the
+        # default C parser
+        pyarrow_engine = _pyarrow_csv_supported(options)
+        options = self._load_defaults | options
+        if pyarrow_engine:
+            options["engine"] = "pyarrow"
         return pd.read_csv(fpath, **options)
 
-    def _dump(self, obj: pd.DataFrame, fpath: Path, **options):
-        options = dict(index=False) | options
+    def _dump(
+        self, obj: pd.DataFrame, fpath: Path, engine: str | None = None, **options
+    ):
+        import pandas as pd
+
+        options = self._dump_defaults | options
+        # the pyarrow writer only supports the default options and flat unique
+        # column names, otherwise and for the columns pyarrow cannot convert or
+        # write, fall back to pandas
+        if (
+            engine == "pyarrow"
+            and options == self._dump_defaults
+            and isinstance(obj, pd.DataFrame)
+            and obj.columns.nlevels == 1
+            and obj.columns.is_unique
+        ):
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+
+            try:
+                table = pa.Table.from_pandas(obj, preserve_index=False)
+                return pacsv.write_csv(
+                    table,
+                    fpath,
+                    write_options=pacsv.WriteOptions(quoting_style="needed"),
+                )
+            except (ValueError, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                pass
         obj.to_csv(fpath, **options)
 
 
+@register_dataio
 class PickleIO(DataIO):
-    fextns: tuple[str, ...] = (".pkl", ".pickle")
-
-    def _load(self, fpath: Path, **options) -> Any:
-        with open(fpath, "rb") as f:
-            return dill.load(f, **options)
-
-    def _dump(self, obj: Any, fpath: Path, **options):
-        with open(fpath, "wb") as f:
-            return dill.dump(obj, f, **options)
+    """Data io for pickle files. Data is dumped with :mod:`dill` by default,
+    so that lambdas and objects defined in ``__main__`` can be loaded in other
+    processes. Files are loaded with the stdlib :mod:`pickle` first, which
+    falls back to dill when pickle fails. Pass ``use_dill=True`` to always use
+    dill, or ``use_dill=False`` to use the faster stdlib pickle, with dill
+    only used for the objects pickle cannot dump.
+
+    Data is dumped with :py:data:`pickle.HIGHEST_PROTOCOL`. With protocol 5,
+    large numpy and pandas buffers are written straight to the file, and with
+    ``use_dill=False`` out-of-band buffers can be handled by passing
+    ``buffer_callback`` to dump and ``buffers`` to load.
 
+    """
 
+    fextns: tuple[str, ...] = (".pkl", ".pickle")
+    _dump_defaults = MappingProxyType(dict(protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _load(self, fpath: Path, use_dill: bool | None = None, **options) -> Any:
+        with _read_buffer(fpath) as content:
+            if not use_dill:
+                try:
+                    return pickle.loads(content, **options)
+                except Exception:
+                    # files written by dill may refer to names that only the
+                    # dill unpickler can resolve, e.g. __builtin__
+                    pass
+            import dill
+
+            return dill.loads(content, **options)
+
+    def _dump(self, obj: Any, fpath: Path, use_dill: bool | None = None, **options):
+        options = self._dump_defaults | options
+        with open(fpath, "wb", buffering=_BUFFER_SIZE) as f:
+            # stdlib pickle dumps functions and classes by reference, which
+            # cannot be resolved outside of the dumping script, so it is opt-in
+            if use_dill is False:
+                try:
+                    return pickle.dump(obj, f, **options)
+                except (pickle.PicklingError, AttributeError, TypeError):
+                    f.seek(0)
+                    f.truncate()
+            import dill
+
+            dill.dump(obj, f, **options)
+
+
+@register_dataio
 class YAMLIO(DataIO):
     fextns: tuple[str, ...] = (".yml", ".yaml")
     dtypes: tuple[Type, ...] = (dict, list)
 
     def _load(self, fpath: Path, **options) -> dict | list:
-        options = dict(Loader=yaml.SafeLoader) | options
-        with open(fpath, "r") as f:
-            return yaml.load(f, **options)
+        import yaml
+
+        # prefer the libyaml based loader when it is available
+        options = dict(Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) | options
+        return yaml.load(fpath.read_bytes(), **options)
 
     def _dump(self, obj: dict | list, fpath: Path, **options):
-        options = dict(Dumper=yaml.SafeDumper) | options
-        with open(fpath, "w") as f:
+        import yaml
+
+        options = dict(Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper)) | options
+        with open(fpath, "w", buffering=_BUFFER_SIZE) as f:
             return yaml.dump(obj, f, **options)
 
 
-class ParquetIO(DataIO):
-    fextns: tuple[str, ...] = (".parquet",)
-    dtypes: tuple[Type, ...] = (pd.DataFrame,)
+@register_dataio
+class ParquetIO(_PandasDataIO):
+    """Data io for parquet files. Files are read memory-mapped with pyarrow and
+    converted to data frames backed by the pyarrow arrays without a copy. Pass
+    ``dtype_backend="numpy_nullable"``, another ``engine`` or other
+    :func:`pandas.read_parquet` only options to read through pandas instead,
+    and ``dtype_backend=None`` to read through pandas with the numpy dtypes.
+    Pass ``engine="polars"`` to read large files with polars, the result is
+    still converted to a :class:`pandas.DataFrame`.
+
+    Data frames are dumped with zstd compression at level 3, pass another
+    ``compression``, e.g. ``"snappy"`` for the pandas default, to override
+    both. The level is only set for the pyarrow engine.
 
-    def _load(self, fpath: Path, **options) -> pd.DataFrame:
-        options = dict(engine="pyarrow") | options
-        return pd.read_parquet(fpath, **options)
+    """
+
+    fextns: tuple[str, ...] = (".parquet",)
+    _load_defaults = MappingProxyType(dict(memory_map=True, use_pandas_metadata=True))
+    _dump_defaults = MappingProxyType(dict(engine="pyarrow", compression="zstd"))
+
+    def _load(
+        self, fpath: Path, as_arrow: bool = False, **options
+    ) -> pd.DataFrame | pa.Table:
+        engine = options.pop("engine", "pyarrow")
+        if engine == "polars":
+            import polars as pl
+
+            return pl.read_parquet(fpath, **options).to_pandas(
+                use_pyarrow_extension_array=True
+            )
+
+        import pandas as pd
+
+        # the pyarrow dtypes are only the default for the pyarrow engine
+        dtype_backend = options.pop(
+            "dtype_backend", "pyarrow" if engine == "pyarrow" else None
+        )
+        if not as_arrow and (
+            engine != "pyarrow"
+            or dtype_backend != "pyarrow"
+            or "storage_options" in options
+        ):
+            # dtype_backend=None keeps the pandas default
+            if dtype_backend is not None:
+                options["dtype_backend"] = dtype_backend
+            return pd.read_parquet(fpath, engine=engine, **options)
+
+        import pyarrow.parquet as pq
+
+        # columns and filters are pushed down to the parquet reader, with
+        # as_arrow=True the pyarrow table is returned without pandas conversion
+        table = pq.read_table(fpath, **(self._load_defaults | options))
+        if as_arrow:
+            return table
+        return table.to_pandas(
+            types_mapper=pd.ArrowDtype, split_blocks=True, self_destruct=True
+        )
 
     def _dump(self, obj: pd.DataFrame, fpath: Path, **options):
-        options = dict(engine="pyarrow") | options
+        options = self._dump_defaults | options
+        # the level only applies to the zstd codec of the pyarrow engine, other
+        # codecs like snappy and other engines do not support setting it
+        if options["engine"] == "pyarrow" and options["compression"] == "zstd":
+            options = dict(compression_level=3) | options
         obj.to_parquet(fpath, **options)
 
 
+@register_dataio
+class FeatherIO(_PandasDataIO):
+    """Data io for feather files, i.e. the Arrow IPC file format. Files are
+    dumped uncompressed so that they can be read memory-mapped and converted
+    to data frames backed by the pyarrow arrays without a copy. Pass
+    ``as_arrow=True`` to get the :class:`pyarrow.Table` without the pandas
+    conversion.
+
+    """
+
+    fextns: tuple[str, ...] = (".feather", ".arrow")
+    _load_defaults = MappingProxyType(dict(memory_map=True))
+    _dump_defaults = MappingProxyType(dict(compression="uncompressed"))
+
+    def _load(
+        self, fpath: Path, as_arrow: bool = False, **options
+    ) -> pd.DataFrame | pa.Table:
+        import pyarrow.feather as feather
+
+        table = feather.read_table(fpath, **(self._load_defaults | options))
+        if as_arrow:
+            return table
+
+        import pandas as pd
+
+        return table.to_pandas(
+            types_mapper=pd.ArrowDtype, split_blocks=True, self_destruct=True
+        )
+
+    def _dump(self, obj: pd.DataFrame, fpath: Path, **options):
+        import pyarrow.feather as feather
+
+        options = self._dump_defaults | options
+        feather.write_feather(obj, fpath, **options)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    # NaN and infinity, which the fast json encoders write as null
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(map(_has_non_finite, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return any(map(_has_non_finite, obj))
+    if "numpy" in sys.modules:
+        import numpy as np
+
+        if isinstance(obj, (np.ndarray, np.floating)) and obj.dtype.kind == "f":
+            return not np.isfinite(obj).all()
+    return False
+
+
+def _numpy_to_builtin(obj: Any) -> Any:
+    # the stdlib json fallback for the numpy objects the fast encoders support
+    if "numpy" in sys.modules:
+        import numpy as np
+
+        if isinstance(obj, (np.ndarray, np.generic)):
+            return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@register_dataio
 class JSONIO(DataIO):
     fextns: tuple[str, ...] = (".json",)
     dtypes: tuple[Type, ...] = (dict, list)
 
     def _load(self, fpath: Path, **options) -> dict | list:
-        with open(fpath, "r") as f:
-            return json.load(f, **options)
+        with _read_buffer(fpath) as content:
+            # orjson or msgspec is used when it is installed and no extra
+            # options are passed
+            if not options:
+                try:
+                    if orjson is not None:
+                        return orjson.loads(content)
+                    if msgspec is not None:
+                        return msgspec.json.decode(content)
+                except ValueError:
+                    # content that the fast parsers reject, e.g. NaN or
+                    # integers beyond 64 bit
+                    pass
+            return json.loads(bytes(content), **options)
 
     def _dump(self, obj: dict | list, fpath: Path, **options):
-        with open(fpath, "w") as f:
+        content = None
+        if not options:
+            try:
+                if orjson is not None:
+                    content = orjson.dumps(
+                        obj,
+                        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                    )
+                elif msgspec is not None:
+                    content = msgspec.json.encode(obj)
+            except TypeError:
+                # objects that the fast encoders reject
+                pass
+        # the fast encoders write NaN and infinity as null, objects with them
+        # are dumped with the stdlib json instead, which keeps them, the object
+        # is only searched when the content has a null
+        if content is not None and not (b"null" in content and _has_non_finite(obj)):
+            with open(fpath, "wb") as f:
+                f.write(content)
+            return
+        if not options:
+            options = dict(default=_numpy_to_builtin)
+        with open(fpath, "w", buffering=_BUFFER_SIZE) as f:
             json.dump(obj, f, **options)
 
 
+@register_dataio
 class TOMLIO(DataIO):
     fextns: tuple[str, ...] = (".toml",)
     dtypes: tuple[Type, ...] = (dict,)
 
     def _load(self, fpath: Path, **options) -> dict:
-        with open(fpath, "rb") as f:
-            return tomli.load(f, **options)
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib
+
+        return tomllib.loads(fpath.read_bytes().decode(), **options)
 
     def _dump(self, obj: dict, fpath: Path, **options):
-        with open(fpath, "wb") as f:
+        import tomli_w
+
+        with open(fpath, "wb", buffering=_BUFFER_SIZE) as f:
             tomli_w.dump(obj, f)
 
 
-csvio = CSVIO()
-yamlio = YAMLIO()
-pickleio = PickleIO()
-parquetio = ParquetIO()
-jsonio = JSONIO()
-tomlio = TOMLIO()
+@register_dataio
+class NumpyIO(DataIO):
+    """Data io for numpy ``.npy`` files. Arrays are stored in their raw binary
+    layout without pickling, pass ``mmap_mode="r"`` to load the array
+    memory-mapped instead of reading it into memory.
+
+    """
+
+    fextns: tuple[str, ...] = (".npy",)
+    dtypes = _LazyDtypes("numpy", "ndarray")
+
+    def _load(self, fpath: Path, **options) -> np.ndarray:
+        import numpy as np
+
+        return np.load(fpath, **options)
+
+    def _dump(self, obj: np.ndarray, fpath: Path, **options):
+        import numpy as np
+
+        with open(fpath, "wb", buffering=_BUFFER_SIZE) as f:
+            np.save(f, obj, **options)
+
+
+class _PolarsDataIO(DataIO):
+    """Base class for data ios of :class:`polars.DataFrame`. Polars is only
+    imported when the data types are checked or a file is loaded.
+
+    """
+
+    dtypes = _LazyDtypes("polars", "DataFrame")
+
+
+class PolarsCSVIO(_PolarsDataIO):
+    """Data io for csv files using polars. It is not registered by default,
+    use ``register_dataio(PolarsCSVIO)`` to read and write csv files as
+    :class:`polars.DataFrame`.
+
+    """
+
+    fextns: tuple[str, ...] = (".csv",)
+
+    def _load(self, fpath: Path, **options) -> pl.DataFrame:
+        import polars as pl
+
+        return pl.read_csv(fpath, **options)
+
+    def _dump(self, obj: pl.DataFrame, fpath: Path, **options):
+        obj.write_csv(fpath, **options)
+
+
+class PolarsParquetIO(_PolarsDataIO):
+    """Data io for parquet files using polars. It is not registered by
+    default, use ``register_dataio(PolarsParquetIO)`` to read and write
+    parquet files as :class:`polars.DataFrame`.
+
+    """
+
+    fextns: tuple[str, ...] = (".parquet",)
+
+    def _load(self, fpath: Path, **options) -> pl.DataFrame:
+        import polars as pl
+
+        return pl.read_parquet(fpath, **options)
 
-_dataio_list: list[DataIO] = [
-    csvio,
-    yamlio,
-    pickleio,
-    parquetio,
-    jsonio,
-    tomlio,
-]
+    def _dump(self, obj: pl.DataFrame, fpath: Path, **options):
+        obj.write_parquet(fpath, **options)
 
 
-dataio_dict: dict[str, DataIO] = {
-    fextn: dataio for dataio in _dataio_list for fextn in dataio.fextns
-}
-"""Instances of data ios, organized in a dictionary with key as the file
-extensions for each :class:`DataIO` class.
+dataio_dict: Mapping[str, DataIO] = MappingProxyType(_dataio_dict)
+"""Instances of data ios, organized in a read-only dictionary with key as the
+file extensions for each :class:`DataIO` class. Use :func:`register_dataio`
+to add new data ios.
 
 """
+
+csvio = dataio_dict[".csv"]
+yamlio = dataio_dict[".yaml"]
+pickleio = dataio_dict[".pkl"]
+parquetio = dataio_dict[".parquet"]
+featherio = dataio_dict[".feather"]
+jsonio = dataio_dict[".json"]
+tomlio = dataio_dict[".toml"]
+numpyio = dataio_dict[".npy"]
+
+
+def load(fpath: str | Path, **options) -> Any:
+    """Load data from given path with the data io registered for its file
+    extension in :py:data:`dataio_dict`.
+
+    Parameters
+    ----------
+    fpath
+        Provided file path.
+    options
+        Extra arguments for the load function.
+
+    Returns
+    -------
+    Any
+        Data loaded from the given path.
+
+    """
+    if not isinstance(fpath, Path):
+        fpath = Path(fpath)
+    # the data io is selected by the suffix, no need to check it again
+    return _dataio_dict[fpath.suffix]._load(fpath, **options)
+
+
+def dump(obj: Any, fpath: str | Path, mkdir: bool = True, **options):
+    """Dump data to given path with the data io registered for its file
+    extension in :py:data:`dataio_dict`.
+
+    Parameters
+    ----------
+    obj
+        Provided data object.
+    fpath
+        Provided file path.
+    mkdir
+        If true, it will automatically create the parent directory. The
+        default is true.
+    options
+        Extra arguments for the dump function.
+
+    """
+    if not isinstance(fpath, Path):
+        fpath = Path(fpath)
+    _dataio_dict[fpath.suffix].dump(obj, fpath, mkdir=mkdir, **options)
+
+
+def load_many(
+    fpaths: Iterable[str | Path], max_workers: int | None = None, **options
+) -> list[Any]:
+    """Load data from multiple paths concurrently with a thread pool. The
+    readers of pandas, pyarrow and pickle release the GIL while parsing and
+    reading the files.
+
+    Parameters
+    ----------
+    fpaths
+        Provided file paths.
+    max_workers
+        Maximum number of threads. The default is the default of
+        :class:`concurrent.futures.ThreadPoolExecutor`.
+    options
+        Extra arguments for the load function, shared by all files.
+
+    Returns
+    -------
+    list[Any]
+        Data loaded from the given paths, in the same order.
+
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda fpath: load(fpath, **options), fpaths))
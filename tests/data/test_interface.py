@@ -1,58 +1,145 @@
+import asyncio
+import copy
+import pickle
 import shutil
-from pathlib import Path
 
-import numpy as np
 import pandas as pd
 import pytest
 
 from pplkit.data.interface import DataInterface
 
-tmpdir = Path(__file__).parents[1] / "tmp"
-
 
 @pytest.fixture
 def data():
     return {"a": [1, 2, 3], "b": [4, 5, 6]}
 
 
-@pytest.fixture(scope="class", autouse=True)
-def rm_tmpdir_after_tests():
-    yield
-    if tmpdir.exists():
-        shutil.rmtree(tmpdir)
-
-
 @pytest.mark.parametrize("fextn", [".json", ".yaml", ".pkl", ".csv", ".parquet"])
-def test_data_interface(data, fextn):
-    dataif = DataInterface(tmp=tmpdir)
+def test_data_interface(data, fextn, tmp_path):
+    dataif = DataInterface(tmp=tmp_path)
     if fextn in [".csv", ".parquet"]:
         data = pd.DataFrame(data)
     dataif.dump_tmp(data, "data" + fextn)
     loaded_data = dataif.load_tmp("data" + fextn)
 
     for key in ["a", "b"]:
-        assert np.allclose(data[key], loaded_data[key])
+        assert list(loaded_data[key]) == list(data[key])
+
+
+def test_load_many_dump_many(data, tmp_path):
+    dataif = DataInterface(tmp=tmp_path)
+    fnames = [f"data_{i}.json" for i in range(4)]
+    dataif.dump_many([data] * 4, fnames, key="tmp")
+    loaded_data = dataif.load_many(fnames, key="tmp")
+
+    assert loaded_data == [data] * 4
+
+
+def test_dump_many_length_mismatch(data, tmp_path):
+    dataif = DataInterface(tmp=tmp_path)
+    with pytest.raises(ValueError):
+        dataif.dump_many([data] * 2, ["data_0.json"], key="tmp")
+    assert not (tmp_path / "data_0.json").exists()
+
 
+def test_load_many_async(data, tmp_path):
+    dataif = DataInterface(tmp=tmp_path)
+    fnames = [f"data_{i}.json" for i in range(4)]
+    dataif.dump_many([data] * 4, fnames, key="tmp")
+    loaded_data = asyncio.run(dataif.load_many_async(fnames, key="tmp"))
 
-def test_add_dir():
+    assert loaded_data == [data] * 4
+
+
+def test_add_dir(tmp_path):
     dataif = DataInterface()
     assert len(dataif.keys) == 0
-    dataif.add_dir("tmp", tmpdir)
+    dataif.add_dir("tmp", tmp_path)
     assert len(dataif.keys) == 1
     assert hasattr(dataif, "tmp")
     assert hasattr(dataif, "load_tmp")
     assert hasattr(dataif, "dump_tmp")
 
 
-def test_add_dir_exist_ok():
-    dataif = DataInterface(tmp=tmpdir)
+def test_add_dir_exist_ok(tmp_path):
+    dataif = DataInterface(tmp=tmp_path)
+    with pytest.raises(ValueError):
+        dataif.add_dir("tmp", tmp_path)
+    dataif.add_dir("tmp", tmp_path, exist_ok=True)
+
+
+@pytest.mark.parametrize("key", ["many", "many_async"])
+def test_add_dir_reserved(tmp_path, key):
     with pytest.raises(ValueError):
-        dataif.add_dir("tmp", tmpdir)
-    dataif.add_dir("tmp", tmpdir, exist_ok=True)
+        DataInterface(**{key: tmp_path})
 
 
-def test_remove_dir():
-    dataif = DataInterface(tmp=tmpdir)
+def test_remove_dir(tmp_path):
+    dataif = DataInterface(tmp=tmp_path)
     assert len(dataif.keys) == 1
     dataif.remove_dir("tmp")
     assert len(dataif.keys) == 0
+
+
+def test_remove_dir_after_access(tmp_path):
+    dataif = DataInterface(tmp=tmp_path)
+    assert callable(dataif.load_tmp)
+    dataif.remove_dir("tmp")
+    assert not hasattr(dataif, "load_tmp")
+    assert not hasattr(dataif, "dump_tmp")
+
+
+def test_get_fpath_after_add_dir(tmp_path):
+    dataif = DataInterface(tmp=tmp_path)
+    assert dataif.get_fpath("data.json", key="tmp") == tmp_path / "data.json"
+    dataif.add_dir("tmp", tmp_path / "sub", exist_ok=True)
+    assert dataif.get_fpath("data.json", key="tmp") == tmp_path / "sub" / "data.json"
+
+
+def test_dir_reassigned(data, tmp_path):
+    dataif = DataInterface(tmp=tmp_path)
+    dataif.dump_tmp(data, "data.json")
+    dataif.tmp = tmp_path / "sub"
+    assert dataif.get_fpath("data.json", key="tmp") == tmp_path / "sub" / "data.json"
+    dataif.dump_tmp(data, "data.json")
+
+    assert (tmp_path / "sub" / "data.json").exists()
+    assert dataif.load_tmp("data.json") == data
+
+
+@pytest.mark.parametrize("fextn", [".json", ".parquet"])
+def test_dump_after_dir_removed(data, tmp_path, fextn):
+    if fextn == ".parquet":
+        data = pd.DataFrame(data)
+    dataif = DataInterface(tmp=tmp_path / "sub")
+    dataif.dump_tmp(data, "data" + fextn)
+    shutil.rmtree(tmp_path / "sub")
+    dataif.dump_tmp(data, "data" + fextn)
+    loaded_data = dataif.load_tmp("data" + fextn)
+
+    for key in ["a", "b"]:
+        assert list(loaded_data[key]) == list(data[key])
+
+
+def test_pickle(data, tmp_path):
+    dataif = DataInterface(tmp=tmp_path)
+    dataif.dump_tmp(data, "data.json")
+    dataif = pickle.loads(pickle.dumps(dataif))
+
+    assert dataif.get_fpath("data.json", key="tmp") == tmp_path / "data.json"
+    assert dataif.load_tmp("data.json") == data
+
+
+@pytest.mark.parametrize("copy_func", [copy.copy, copy.deepcopy])
+def test_copy(tmp_path, copy_func):
+    dataif = DataInterface(tmp=tmp_path)
+    assert dataif.get_fpath("data.json", key="tmp") == tmp_path / "data.json"
+    dataif_copy = copy_func(dataif)
+    dataif_copy.add_dir("tmp", tmp_path / "sub", exist_ok=True)
+    dataif_copy.add_dir("other", tmp_path)
+
+    assert (
+        dataif_copy.get_fpath("data.json", key="tmp") == tmp_path / "sub" / "data.json"
+    )
+    assert dataif.get_fpath("data.json", key="tmp") == tmp_path / "data.json"
+    assert dataif.keys == ["tmp"]
@@ -1,20 +1,30 @@
-import shutil
-from pathlib import Path
+import math
+import subprocess
+import sys
 
 import numpy as np
 import pandas as pd
 import pytest
 
-from pplkit.data.io import CSVIO, JSONIO, TOMLIO, YAMLIO, ParquetIO, PickleIO
-
-tmpdir = Path(__file__).parents[1] / "tmp"
-
-
-@pytest.fixture(scope="class", autouse=True)
-def rm_tmpdir_after_tests():
-    yield
-    if tmpdir.exists():
-        shutil.rmtree(tmpdir)
+from pplkit.data.io import (
+    CSVIO,
+    JSONIO,
+    TOMLIO,
+    YAMLIO,
+    DataIO,
+    FeatherIO,
+    NumpyIO,
+    ParquetIO,
+    PickleIO,
+    PolarsCSVIO,
+    PolarsParquetIO,
+    _dataio_dict,
+    dataio_dict,
+    dump,
+    load,
+    load_many,
+    register_dataio,
+)
 
 
 @pytest.fixture
@@ -22,57 +32,471 @@ def data():
     return {"a": [1, 2, 3], "b": [4, 5, 6]}
 
 
-def test_csvio(data):
+def test_csvio(data, tmp_path):
+    data = pd.DataFrame(data)
+    port = CSVIO()
+    port.dump(data, tmp_path / "file.csv")
+    loaded_data = port.load(tmp_path / "file.csv")
+
+    for key in ["a", "b"]:
+        assert loaded_data[key].tolist() == data[key].tolist()
+
+
+def test_csvio_c_engine_options(data, tmp_path):
+    data = pd.DataFrame(data)
+    port = CSVIO()
+    port.dump(data, tmp_path / "file.csv")
+    loaded_data = port.load(tmp_path / "file.csv", nrows=2)
+
+    assert len(loaded_data) == 2
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        dict(usecols=[0, 1]),
+        dict(usecols=lambda col: col in ["a", "b"]),
+        dict(index_col=False),
+        dict(na_values={"a": [1]}),
+    ],
+)
+def test_csvio_c_engine_option_values(data, tmp_path, options):
+    data = pd.DataFrame(data)
+    port = CSVIO()
+    port.dump(data, tmp_path / "file.csv")
+    loaded_data = port.load(tmp_path / "file.csv", **options)
+
+    assert loaded_data.columns.tolist() == ["a", "b"]
+    assert loaded_data["b"].tolist() == data["b"].tolist()
+
+
+def test_csvio_as_arrow(data, tmp_path):
+    data = pd.DataFrame(data)
+    port = CSVIO()
+    port.dump(data, tmp_path / "file.csv")
+    loaded_data = port.load(tmp_path / "file.csv", as_arrow=True)
+
+    assert loaded_data.column_names == ["a", "b"]
+    for key in ["a", "b"]:
+        assert loaded_data[key].to_pylist() == data[key].tolist()
+
+
+def test_csvio_dump_format(data, tmp_path):
+    data = pd.DataFrame(data)
+    data["c"] = ["x", "y,z", "w"]
+    data["d"] = [True, False, True]
+    data["e"] = pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03"])
+    port = CSVIO()
+    port.dump(data, tmp_path / "file.csv")
+
+    assert (tmp_path / "file.csv").read_text() == data.to_csv(index=False)
+
+
+def test_csvio_dump_pyarrow(data, tmp_path):
+    data = pd.DataFrame(data)
+    port = CSVIO()
+    port.dump(data, tmp_path / "file.csv", engine="pyarrow")
+    loaded_data = port.load(tmp_path / "file.csv")
+
+    for key in ["a", "b"]:
+        assert loaded_data[key].tolist() == data[key].tolist()
+
+
+@pytest.mark.parametrize(
+    "columns",
+    [["a", "a"], pd.MultiIndex.from_tuples([("a", "x"), ("a", "y")])],
+)
+def test_csvio_dump_pyarrow_columns(data, tmp_path, columns):
+    data = pd.DataFrame(data)
+    data.columns = columns
+    port = CSVIO()
+    port.dump(data, tmp_path / "file.csv", engine="pyarrow")
+
+    assert (tmp_path / "file.csv").read_text() == data.to_csv(index=False)
+
+
+def test_csvio_dump_mixed_object(data, tmp_path):
     data = pd.DataFrame(data)
+    data["c"] = [1, "x", None]
     port = CSVIO()
-    port.dump(data, tmpdir / "file.csv")
-    loaded_data = port.load(tmpdir / "file.csv")
+    port.dump(data, tmp_path / "file.csv", engine="pyarrow")
+    loaded_data = port.load(tmp_path / "file.csv")
 
+    assert loaded_data["c"].tolist()[:2] == ["1", "x"]
     for key in ["a", "b"]:
-        assert np.allclose(data[key], loaded_data[key])
+        assert loaded_data[key].tolist() == data[key].tolist()
 
 
-def test_jsonio(data):
+def test_csvio_dump_options(data, tmp_path):
+    data = pd.DataFrame(data)
+    port = CSVIO()
+    port.dump(data, tmp_path / "file.csv", sep=";")
+
+    assert (tmp_path / "file.csv").read_text().splitlines()[0] == "a;b"
+
+
+@pytest.mark.parametrize("port, fextn", [(CSVIO(), ".csv"), (ParquetIO(), ".parquet")])
+def test_numpy_dtype_backend(data, tmp_path, port, fextn):
+    data = pd.DataFrame(data)
+    data["c"] = ["x", "y", "z"]
+    port.dump(data, tmp_path / f"file{fextn}")
+    loaded_data = port.load(tmp_path / f"file{fextn}", dtype_backend=None)
+
+    assert loaded_data.dtypes.tolist() == data.dtypes.tolist()
+
+
+def test_jsonio(data, tmp_path):
     port = JSONIO()
-    port.dump(data, tmpdir / "file.json")
-    loaded_data = port.load(tmpdir / "file.json")
+    port.dump(data, tmp_path / "file.json")
+    loaded_data = port.load(tmp_path / "file.json")
 
     for key in ["a", "b"]:
-        assert np.allclose(data[key], loaded_data[key])
+        assert loaded_data[key] == data[key]
+
+
+def test_jsonio_non_finite(tmp_path):
+    data = {"a": float("nan"), "b": float("inf"), "c": None, "d": [1.5]}
+    port = JSONIO()
+    port.dump(data, tmp_path / "file.json")
+    loaded_data = port.load(tmp_path / "file.json")
+
+    assert math.isnan(loaded_data.pop("a"))
+    assert loaded_data == {"b": float("inf"), "c": None, "d": [1.5]}
+
+
+def test_jsonio_numpy_non_finite(tmp_path):
+    data = {"a": np.array([1.0, np.nan]), "b": np.float32("inf"), "c": np.arange(2)}
+    port = JSONIO()
+    port.dump(data, tmp_path / "file.json")
+    loaded_data = port.load(tmp_path / "file.json")
+
+    assert loaded_data["a"][0] == 1.0 and math.isnan(loaded_data["a"][1])
+    assert loaded_data["b"] == float("inf")
+    assert loaded_data["c"] == [0, 1]
+
+
+def test_jsonio_null(tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    monkeypatch.setattr("pplkit.data.io.json.dump", None)
+    data = {"a": None, "b": "null"}
+    port = JSONIO()
+    port.dump(data, tmp_path / "file.json")
+    loaded_data = port.load(tmp_path / "file.json")
+
+    assert loaded_data == data
 
 
-def test_yamlio(data):
+def test_jsonio_big_int(tmp_path):
+    data = {"a": 2**70}
+    port = JSONIO()
+    port.dump(data, tmp_path / "file.json")
+    loaded_data = port.load(tmp_path / "file.json")
+
+    assert loaded_data == data
+
+
+def test_jsonio_large_file(tmp_path):
+    data = {"a": list(range(300_000))}
+    port = JSONIO()
+    port.dump(data, tmp_path / "file.json")
+    assert (tmp_path / "file.json").stat().st_size > 1 << 20
+    loaded_data = port.load(tmp_path / "file.json")
+    assert loaded_data == data
+    loaded_data = port.load(tmp_path / "file.json", parse_int=float)
+    assert loaded_data == data
+
+
+def test_jsonio_msgspec(data, tmp_path, monkeypatch):
+    msgspec = pytest.importorskip("msgspec")
+    pytest.importorskip("msgspec.json")
+    monkeypatch.setattr("pplkit.data.io.orjson", None)
+    monkeypatch.setattr("pplkit.data.io.msgspec", msgspec)
+    data["c"] = float("nan")
+    data["d"] = float("-inf")
+    port = JSONIO()
+    port.dump(data, tmp_path / "file.json")
+    loaded_data = port.load(tmp_path / "file.json")
+
+    assert math.isnan(loaded_data.pop("c"))
+    assert loaded_data == {"a": [1, 2, 3], "b": [4, 5, 6], "d": float("-inf")}
+
+
+def test_yamlio(data, tmp_path):
     port = YAMLIO()
-    port.dump(data, tmpdir / "file.yaml")
-    loaded_data = port.load(tmpdir / "file.yaml")
+    port.dump(data, tmp_path / "file.yaml")
+    loaded_data = port.load(tmp_path / "file.yaml")
+
+    for key in ["a", "b"]:
+        assert loaded_data[key] == data[key]
+
+
+def test_parquetio(data, tmp_path):
+    data = pd.DataFrame(data)
+    port = ParquetIO()
+    port.dump(data, tmp_path / "file.parquet")
+    loaded_data = port.load(tmp_path / "file.parquet")
+
+    for key in ["a", "b"]:
+        assert loaded_data[key].tolist() == data[key].tolist()
+
+
+@pytest.mark.parametrize("compression", ["snappy", None, "zstd"])
+def test_parquetio_compression(data, tmp_path, compression):
+    data = pd.DataFrame(data)
+    port = ParquetIO()
+    port.dump(data, tmp_path / "file.parquet", compression=compression)
+    loaded_data = port.load(tmp_path / "file.parquet")
 
     for key in ["a", "b"]:
-        assert np.allclose(data[key], loaded_data[key])
+        assert loaded_data[key].tolist() == data[key].tolist()
 
 
-def test_parquetio(data):
+def test_parquetio_fastparquet(data, tmp_path):
+    pytest.importorskip("fastparquet")
     data = pd.DataFrame(data)
     port = ParquetIO()
-    port.dump(data, tmpdir / "file.parquet")
-    loaded_data = port.load(tmpdir / "file.parquet")
+    port.dump(data, tmp_path / "file.parquet", engine="fastparquet")
+    loaded_data = port.load(tmp_path / "file.parquet", engine="fastparquet")
 
     for key in ["a", "b"]:
-        assert np.allclose(data[key], loaded_data[key])
+        assert loaded_data[key].tolist() == data[key].tolist()
 
 
-def test_pickleio(data):
+def test_parquetio_numpy_nullable(data, tmp_path):
+    data = pd.DataFrame(data)
+    port = ParquetIO()
+    port.dump(data, tmp_path / "file.parquet")
+    loaded_data = port.load(tmp_path / "file.parquet", dtype_backend="numpy_nullable")
+
+    assert (loaded_data.dtypes == "Int64").all()
+    for key in ["a", "b"]:
+        assert loaded_data[key].tolist() == data[key].tolist()
+
+
+def test_parquetio_as_arrow(data, tmp_path):
+    data = pd.DataFrame(data)
+    port = ParquetIO()
+    port.dump(data, tmp_path / "file.parquet")
+    loaded_data = port.load(tmp_path / "file.parquet", as_arrow=True, columns=["a"])
+
+    assert loaded_data.column_names == ["a"]
+    assert loaded_data["a"].to_pylist() == data["a"].tolist()
+
+
+@pytest.mark.parametrize("fextn", [".feather", ".arrow"])
+def test_featherio(data, fextn, tmp_path):
+    data = pd.DataFrame(data)
+    port = FeatherIO()
+    port.dump(data, tmp_path / f"file{fextn}")
+    loaded_data = port.load(tmp_path / f"file{fextn}")
+
+    for key in ["a", "b"]:
+        assert loaded_data[key].tolist() == data[key].tolist()
+
+
+def test_featherio_as_arrow(data, tmp_path):
+    data = pd.DataFrame(data)
+    port = FeatherIO()
+    port.dump(data, tmp_path / "file.feather")
+    loaded_data = port.load(tmp_path / "file.feather", as_arrow=True, columns=["a"])
+
+    assert loaded_data.column_names == ["a"]
+    assert loaded_data["a"].to_pylist() == data["a"].tolist()
+
+
+@pytest.mark.parametrize("port, fextn", [(CSVIO(), ".csv"), (ParquetIO(), ".parquet")])
+def test_polars_engine(data, port, fextn, tmp_path):
+    pytest.importorskip("polars")
+    data = pd.DataFrame(data)
+    port.dump(data, tmp_path / f"file{fextn}")
+    loaded_data = port.load(tmp_path / f"file{fextn}", engine="polars")
+
+    assert isinstance(loaded_data, pd.DataFrame)
+    for key in ["a", "b"]:
+        assert loaded_data[key].tolist() == data[key].tolist()
+
+
+@pytest.mark.parametrize(
+    "port, fextn", [(PolarsCSVIO(), ".csv"), (PolarsParquetIO(), ".parquet")]
+)
+def test_polarsio(data, port, fextn, tmp_path):
+    pl = pytest.importorskip("polars")
+    data = pl.DataFrame(data)
+    port.dump(data, tmp_path / f"file{fextn}")
+    loaded_data = port.load(tmp_path / f"file{fextn}")
+
+    assert isinstance(loaded_data, pl.DataFrame)
+    assert loaded_data.equals(data)
+
+
+def test_pickleio(data, tmp_path):
     port = PickleIO()
-    port.dump(data, tmpdir / "file.pkl")
-    loaded_data = port.load(tmpdir / "file.pkl")
+    port.dump(data, tmp_path / "file.pkl")
+    loaded_data = port.load(tmp_path / "file.pkl")
 
     for key in ["a", "b"]:
-        assert np.allclose(data[key], loaded_data[key])
+        assert loaded_data[key] == data[key]
+
+
+def test_pickleio_load_dill_file(tmp_path):
+    # files written by dill.dump in a script, e.g. lambdas in __main__
+    code = (
+        "import dill, sys; "
+        "f = open(sys.argv[1], 'wb'); dill.dump({'f': lambda x: x + 1}, f); "
+        "f.close()"
+    )
+    subprocess.run([sys.executable, "-c", code, str(tmp_path / "file.pkl")], check=True)
+    port = PickleIO()
+    loaded_data = port.load(tmp_path / "file.pkl")
+
+    assert loaded_data["f"](1) == 2
+
+
+def test_pickleio_large_file(tmp_path):
+    data = {"a": np.arange(300_000), "f": lambda x: x + 1}
+    port = PickleIO()
+    port.dump(data, tmp_path / "file.pkl")
+    assert (tmp_path / "file.pkl").stat().st_size > 1 << 20
+    loaded_data = port.load(tmp_path / "file.pkl")
+
+    assert np.array_equal(data["a"], loaded_data["a"])
+    assert loaded_data["f"](1) == 2
+
+
+def test_pickleio_dill_fallback(tmp_path):
+    data = {"f": lambda x: x + 1}
+    port = PickleIO()
+    port.dump(data, tmp_path / "file.pkl", use_dill=False)
+    loaded_data = port.load(tmp_path / "file.pkl")
+
+    assert loaded_data["f"](1) == 2
+
+
+def test_pickleio_main_function(tmp_path):
+    # functions defined in a script can be loaded in another process
+    code = (
+        "import sys; from pplkit.data.io import PickleIO; "
+        "exec('def g(x):\\n    return x + 1'); "
+        "PickleIO().dump({'g': g}, sys.argv[1])"
+    )
+    subprocess.run([sys.executable, "-c", code, str(tmp_path / "file.pkl")], check=True)
+    port = PickleIO()
+    loaded_data = port.load(tmp_path / "file.pkl")
+
+    assert loaded_data["g"](1) == 2
 
 
-def test_tomlio(data):
+def test_pickleio_out_of_band_buffers(tmp_path):
+    data = {"a": np.arange(10)}
+    buffers = []
+    port = PickleIO()
+    port.dump(
+        data, tmp_path / "file.pkl", use_dill=False, buffer_callback=buffers.append
+    )
+    loaded_data = port.load(tmp_path / "file.pkl", buffers=buffers)
+
+    assert len(buffers) == 1
+    assert np.array_equal(data["a"], loaded_data["a"])
+
+
+def test_pickleio_use_dill(data, tmp_path):
+    port = PickleIO()
+    port.dump(data, tmp_path / "file.pkl", use_dill=True)
+    loaded_data = port.load(tmp_path / "file.pkl", use_dill=True)
+
+    assert loaded_data == data
+
+
+def test_tomlio(data, tmp_path):
     port = TOMLIO()
-    port.dump(data, tmpdir / "file.toml")
-    loaded_data = port.load(tmpdir / "file.toml")
+    port.dump(data, tmp_path / "file.toml")
+    loaded_data = port.load(tmp_path / "file.toml")
 
     for key in ["a", "b"]:
-        assert np.allclose(data[key], loaded_data[key])
+        assert loaded_data[key] == data[key]
+
+
+@pytest.mark.parametrize("mmap_mode", [None, "r"])
+def test_numpyio(mmap_mode, tmp_path):
+    data = np.arange(10.0)
+    port = NumpyIO()
+    port.dump(data, tmp_path / "file.npy")
+    loaded_data = port.load(tmp_path / "file.npy", mmap_mode=mmap_mode)
+
+    assert np.array_equal(data, loaded_data)
+
+
+def test_lazy_imports():
+    code = (
+        "import sys; import pplkit.data.io; "
+        "assert not {'pandas', 'pyarrow', 'numpy', 'dill', 'yaml', 'tomli', "
+        "'tomli_w'} & set(sys.modules)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize("fextn", [".json", ".yaml", ".pkl", ".toml"])
+def test_load_dump(data, fextn, tmp_path):
+    dump(data, tmp_path / f"file{fextn}")
+    loaded_data = load(str(tmp_path / f"file{fextn}"))
+
+    assert loaded_data == data
+
+
+def test_load_many(data, tmp_path):
+    fpaths = [tmp_path / f"file{fextn}" for fextn in [".json", ".yaml", ".pkl"]]
+    for fpath in fpaths:
+        dump(data, fpath)
+    loaded_data = load_many(fpaths)
+
+    assert loaded_data == [data] * 3
+
+
+def test_load_wrong_fextn(tmp_path):
+    with pytest.raises(ValueError):
+        JSONIO().load(tmp_path / "file.yaml")
+
+
+def test_dataio_dict():
+    for fextn, dataio in dataio_dict.items():
+        assert fextn in dataio.fextns
+
+
+def test_dataio_dict_read_only():
+    with pytest.raises(TypeError):
+        dataio_dict[".txt"] = PickleIO()
+
+
+@pytest.mark.parametrize(
+    "cls, dtypes",
+    [(CSVIO, (pd.DataFrame,)), (ParquetIO, (pd.DataFrame,)), (NumpyIO, (np.ndarray,))],
+)
+def test_dataio_dtypes(cls, dtypes):
+    assert cls.dtypes == dtypes
+    assert cls().dtypes == dtypes
+
+
+def test_dataio_abstract():
+    class TextIO(DataIO):
+        fextns = (".txt",)
+
+    with pytest.raises(TypeError):
+        TextIO()
+
+
+def test_register_dataio():
+    @register_dataio
+    class TextIO(DataIO):
+        fextns = (".txt",)
+        dtypes = (str,)
+
+        def _load(self, fpath, **options):
+            return fpath.read_text()
+
+        def _dump(self, obj, fpath, **options):
+            fpath.write_text(obj)
+
+    try:
+        assert isinstance(dataio_dict[".txt"], TextIO)
+    finally:
+        _dataio_dict.pop(".txt")